@@ -1,6 +1,15 @@
+import logging
 import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import streamlit as st
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Literal, TypedDict, Union
 
 # --- TYPES ---
@@ -37,6 +46,15 @@ DecodeResult = Union[DecodeResultSuccess, DecodeResultError]
 
 # --- CONFIGURATION ---
 API_BASE = "https://dualsubstrate-commercial.fly.dev"
+REQUEST_TIMEOUT = (3, 10)
+DECODE_CACHE_TTL = 300
+DECODE_CACHE_MAX_ENTRIES = 512
+MAX_DECODE_WORKERS = 8
+SUMMARY_BLOB_CHARS = 256
+ERROR_DETAIL_BYTES = 2048
+BATCH_RETRY_SECONDS = 300
+
+logger = logging.getLogger(__name__)
 
 st.set_page_config(
     page_title="Web4 Universal Resolver",
@@ -65,87 +83,133 @@ st.title("DualSubstrate // Resolver")
 
 # --- HELPER FUNCTIONS ---
 
-def normalize_success(payload: dict, coord_hint: str) -> DecodeResultSuccess:
-    """Normalize backend payloads into a consistent shape."""
-    if "coord" in payload and "skim" in payload:
-        skim = payload.get("skim") or {}
-        governance = payload.get("governance") or {}
-        appraisal = governance.get("appraisal") if isinstance(governance, dict) else {}
-        if not isinstance(appraisal, dict):
-            appraisal = {}
-        meta_payload = payload.get("meta") or {}
-
-        payload_text = ""
-        payload_blob = payload.get("payload")
-        if isinstance(payload_blob, dict):
-            blobs = payload_blob.get("blobs")
-            segments = payload_blob.get("segments")
-            if isinstance(blobs, dict) and isinstance(segments, list):
-                for segment in segments:
-                    if not isinstance(segment, dict):
-                        continue
-                    blob_ref = segment.get("blob_ref")
-                    if blob_ref and isinstance(blobs.get(blob_ref), str):
-                        payload_text = blobs[blob_ref].strip()
-                        break
-
-        claims = []
-        interpretation = payload.get("interpretation") or {}
-        if isinstance(interpretation, dict):
-            for claim in interpretation.get("claims") or []:
-                if isinstance(claim, dict):
-                    label = claim.get("label")
-                    if label:
-                        claims.append(str(label))
-                elif claim:
-                    claims.append(str(claim))
-
-        normalized_meta: Meta = {
-            "namespace": meta_payload.get("namespace_used")
-                or meta_payload.get("namespace")
-                or (coord_hint.split(":")[0] if ":" in coord_hint else coord_hint),
-            "type": payload.get("type") or "unknown",
-            "coherence": appraisal.get("coherence") or appraisal.get("score") or appraisal.get("grace") or "N/A",
-            "mediator": appraisal.get("law") or meta_payload.get("provider") or "N/A",
-            "timestamp": meta_payload.get("created_at") or "N/A",
-            "raw": payload,
-        }
-        normalized_content: Content = {
-            "summary": skim.get("one_line") or payload_text or "No summary provided.",
-            "claims": claims,
-            "context": payload.get("coord", ""),
-            "raw": payload.get("payload") or {},
-        }
-        return {
-            "status": "success",
-            "meta": normalized_meta,
-            "primes": [],
-            "content": normalized_content,
-            "raw": payload,
-        }
+@st.cache_resource
+def _session() -> requests.Session:
+    """Shared HTTP session so keep-alive connections are reused across calls."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    )
+    session.mount("https://", adapter)
+    session.headers.update({"Content-Type": "application/json"})
+    return session
+
+
+_EMPTY: dict = {}
+
+
+def _first(source: dict, *keys: str, default=None):
+    """Return the first truthy value among ``keys`` in ``source``."""
+    for key in keys:
+        value = source.get(key)
+        if value:
+            return value
+    return default
 
-    meta_source = payload.get("meta") or payload.get("metadata") or {}
-    namespace_hint = payload.get("namespace_used") or payload.get("namespace")
+
+@lru_cache(maxsize=2048)
+def _ns_of(coord: str) -> str:
+    """Namespace prefix of a coordinate (everything before the first ':')."""
+    idx = coord.find(":")
+    return coord[:idx] if idx >= 0 else coord
+
+
+_NON_WS_RE = re.compile(r"\S")
+
+
+def _first_blob_text(payload_blob) -> str:
+    """Text of the first segment whose ``blob_ref`` resolves in ``payload.blobs``."""
+    if not isinstance(payload_blob, dict):
+        return ""
+    blobs = payload_blob.get("blobs")
+    segments = payload_blob.get("segments")
+    if not isinstance(blobs, dict) or not isinstance(segments, list):
+        return ""
+    for segment in segments:
+        blob_ref = segment.get("blob_ref") if isinstance(segment, dict) else None
+        if not isinstance(blob_ref, str):
+            continue
+        blob = blobs.get(blob_ref)
+        if isinstance(blob, str):
+            # Only used as a fallback summary; avoid copying megabyte-scale blobs.
+            match = _NON_WS_RE.search(blob)
+            if not match:
+                return ""
+            start = match.start()
+            end = start + SUMMARY_BLOB_CHARS
+            text = blob[start:end].rstrip()
+            return text + "..." if _NON_WS_RE.search(blob, end) else text
+    return ""
+
+
+def _normalize_ledger(payload: dict, coord_hint: str) -> DecodeResultSuccess:
+    """Ledger records: ``coord`` + ``skim`` with governance and blob payloads."""
+    skim = payload.get("skim") or _EMPTY
+    governance = payload.get("governance") or _EMPTY
+    appraisal = governance.get("appraisal") if isinstance(governance, dict) else _EMPTY
+    if not isinstance(appraisal, dict):
+        appraisal = _EMPTY
+    meta_payload = payload.get("meta") or _EMPTY
+
+    claims = []
+    interpretation = payload.get("interpretation") or _EMPTY
+    if isinstance(interpretation, dict):
+        for claim in interpretation.get("claims") or []:
+            if isinstance(claim, dict):
+                label = claim.get("label")
+                if label:
+                    claims.append(str(label))
+            elif claim:
+                claims.append(str(claim))
+
+    normalized_meta: Meta = {
+        "namespace": _first(meta_payload, "namespace_used", "namespace", default=_ns_of(coord_hint)),
+        "type": payload.get("type") or "unknown",
+        "coherence": _first(appraisal, "coherence", "score", "grace", default="N/A"),
+        "mediator": appraisal.get("law") or meta_payload.get("provider") or "N/A",
+        "timestamp": meta_payload.get("created_at") or "N/A",
+        "raw": payload,
+    }
+    normalized_content: Content = {
+        "summary": skim.get("one_line") or _first_blob_text(payload.get("payload")) or "No summary provided.",
+        "claims": claims,
+        "context": payload.get("coord", ""),
+        "raw": payload.get("payload") or {},
+    }
+    return {
+        "status": "success",
+        "meta": normalized_meta,
+        "primes": [],
+        "content": normalized_content,
+        "raw": payload,
+    }
+
+
+def _normalize_legacy(payload: dict, coord_hint: str) -> DecodeResultSuccess:
+    """Older session/chat payloads with ``meta``/``content`` or flat reply fields."""
+    meta_source = _first(payload, "meta", "metadata", default=_EMPTY)
+    appraisal = meta_source.get("appraisal") or _EMPTY
+    namespace_hint = _first(payload, "namespace_used", "namespace")
 
     normalized_meta: Meta = {
         "namespace": namespace_hint
             or meta_source.get("namespace")
-            or (coord_hint.split(":")[0] if ":" in coord_hint else coord_hint),
-        "type": meta_source.get("type") or meta_source.get("kind") or payload.get("kind") or "unknown",
-        "coherence": meta_source.get("coherence")
-            or meta_source.get("score")
-            or meta_source.get("appraisal", {}).get("score", "N/A"),
-        "mediator": meta_source.get("mediator") or meta_source.get("provider") or payload.get("provider", "N/A"),
+            or _ns_of(coord_hint),
+        "type": _first(meta_source, "type", "kind") or payload.get("kind") or "unknown",
+        "coherence": _first(meta_source, "coherence", "score") or appraisal.get("score", "N/A"),
+        "mediator": _first(meta_source, "mediator", "provider") or payload.get("provider", "N/A"),
         "timestamp": meta_source.get("timestamp")
             or payload.get("created_at")
             or meta_source.get("session_id", "N/A"),
         "raw": meta_source or payload,
     }
 
-    content_payload = payload.get("content") or {}
+    content_payload = payload.get("content") or _EMPTY
     if not content_payload:
         content_payload = {
-            "summary": payload.get("assistant_reply") or payload.get("full_text") or "No summary provided.",
+            "summary": _first(payload, "assistant_reply", "full_text", default="No summary provided."),
             "claims": payload.get("knowledge_tree") or [],
             "context": payload.get("user_message") or coord_hint,
         }
@@ -160,54 +224,208 @@ def normalize_success(payload: dict, coord_hint: str) -> DecodeResultSuccess:
     return {
         "status": "success",
         "meta": normalized_meta,
-        "primes": payload.get("primes") or payload.get("token_primes") or [],
+        "primes": _first(payload, "primes", "token_primes", default=[]),
         "content": normalized_content,
         "raw": payload
     }
 
 
-def decode_coordinate(coord: str, silent: bool = False) -> DecodeResult:
-    """Calls the backend to resolve the coordinate."""
+def normalize_success(payload: dict, coord_hint: str) -> DecodeResultSuccess:
+    """Normalize backend payloads into a consistent shape."""
+    normalizer = _normalize_ledger if "coord" in payload and "skim" in payload else _normalize_legacy
+    return normalizer(payload, coord_hint)
+
+
+
+def _body_excerpt(response: requests.Response) -> str:
+    # Response.text runs charset detection over the whole body; error pages only need a prefix.
+    return response.content[:ERROR_DETAIL_BYTES].decode("utf-8", "replace")
+
+
+def _load_body(response: requests.Response) -> dict:
+    """Parsed JSON body; a non-JSON error page yields {} so callers fall back to _body_excerpt."""
     try:
-        if not silent:
-            with st.status("Establishing Coherence Handshake...", expanded=True) as status:
-                st.write("078095 Parsing Namespace Prefix...")
-                st.write("07806e Verifying Ledger Integrity...")
-
-                response = requests.post(
-                    f"{API_BASE}/web4/decode",
-                    json={"coordinate": coord},
-                    headers={"Content-Type": "application/json"}
-                )
-                status.update(label="Handshake Verified", state="complete")
-        else:
-            response = requests.post(
-                f"{API_BASE}/web4/decode",
-                json={"coordinate": coord},
-                headers={"Content-Type": "application/json"}
-            )
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        if response.ok:
+            raise
+        return {}
+
+
+def _unwrap_body(body: dict) -> dict:
+    return body.get("data") or body.get("result") or body
+
+
+def _is_decoded(body: dict, payload: dict) -> bool:
+    return body.get("status") == "success" or "coord" in payload or "canonical_coord" in payload
+
+
+class _DecodeFailed(Exception):
+    """Raised inside the cached decode so error responses are never memoized."""
+
+    def __init__(self, detail):
+        super().__init__(detail)
+        self.detail = detail
+
+
+@st.cache_resource
+def _decode_index() -> dict:
+    """Coordinates believed to have a live _decode_cached entry, oldest first, with expiry."""
+    return {"lock": threading.Lock(), "expiry": OrderedDict()}
+
+
+def _mark_cached(coord: str) -> None:
+    index = _decode_index()
+    with index["lock"]:
+        expiry = index["expiry"]
+        expiry.pop(coord, None)
+        expiry[coord] = time.monotonic() + DECODE_CACHE_TTL
+        while len(expiry) > DECODE_CACHE_MAX_ENTRIES:
+            expiry.popitem(last=False)
+
+
+def _warm_coords(coords: list[str]) -> set[str]:
+    """Subset of ``coords`` still within the decode cache TTL; expired entries are dropped."""
+    index = _decode_index()
+    now = time.monotonic()
+    with index["lock"]:
+        expiry = index["expiry"]
+        for coord in [coord for coord, expires in expiry.items() if expires <= now]:
+            del expiry[coord]
+        return {coord for coord in coords if coord in expiry}
+
+
+@st.cache_data(ttl=DECODE_CACHE_TTL, max_entries=DECODE_CACHE_MAX_ENTRIES, show_spinner=False)
+def _decode_cached(coord: str, _entry: dict | None = None) -> DecodeResultSuccess:
+    """Fetch and normalize a coordinate; raises _DecodeFailed on backend errors.
+
+    ``_entry`` is a record already fetched by the batch endpoint; it is excluded
+    from the cache key, so a batch result fills the same cache slot as a single decode.
+    """
+    if _entry is None:
+        response = _session().post(
+            f"{API_BASE}/web4/decode",
+            data=orjson.dumps({"coordinate": coord}),
+            timeout=REQUEST_TIMEOUT,
+        )
+        body = _load_body(response)
+        ok = response.ok
+    elif isinstance(_entry, dict):
+        response = None
+        body = _entry
+        ok = True
+    else:
+        raise _DecodeFailed("Malformed batch entry.")
+
+    payload = _unwrap_body(body)
 
-        body = response.json()
-        payload = body.get("data") or body.get("result") or body
+    if ok and _is_decoded(body, payload):
+        result = normalize_success(payload, coord)
+        _mark_cached(coord)
+        return result
 
-        if response.ok and (body.get("status") == "success" or "coord" in payload or "canonical_coord" in payload):
-            return normalize_success(payload, coord)
+    detail = payload.get("detail") or payload.get("error")
+    if not detail:
+        detail = _body_excerpt(response) if response is not None else "Decode failed."
+    raise _DecodeFailed(detail)
 
-        detail = payload.get("detail") or payload.get("error") or response.text
-        return {"status": "error", "detail": detail}
 
+def _decode(coord: str, entry: dict | None = None) -> DecodeResult:
+    try:
+        return _decode_cached(coord, entry)
+    except _DecodeFailed as e:
+        return {"status": "error", "detail": e.detail}
     except Exception as e:
         return {"status": "error", "detail": str(e)}
 
 
+def clear_decode_cache() -> None:
+    _decode_cached.clear()
+    index = _decode_index()
+    with index["lock"]:
+        index["expiry"].clear()
+
 
-def _resolve_walk_start(coord: str) -> tuple[str, str | None, str | None]:
+def decode_coordinate(coord: str, silent: bool = False) -> DecodeResult:
+    """Calls the backend to resolve the coordinate."""
+    if silent:
+        return _decode(coord)
+
+    with st.status("Decoding coordinate...", expanded=False) as status:
+        result = _decode(coord)
+        if result["status"] == "success":
+            status.update(label="Decoded", state="complete")
+        else:
+            status.update(label="Decode failed", state="error")
+    return result
+
+
+
+@st.cache_resource
+def _batch_support() -> dict:
+    """Process-wide backoff: the batch endpoint is skipped until ``retry_at`` (monotonic)."""
+    return {"retry_at": 0.0}
+
+
+def _fetch_batch(coords: list[str]) -> list | None:
+    """Raw batch entries in request order, or None when the endpoint is unusable."""
+    support = _batch_support()
+    if time.monotonic() < support["retry_at"]:
+        return None
+
+    try:
+        response = _session().post(
+            f"{API_BASE}/web4/decode_batch",
+            data=orjson.dumps({"coordinates": coords}),
+            timeout=REQUEST_TIMEOUT,
+        )
+        if response.status_code in (404, 405):
+            logger.info("Batch decode endpoint not available (HTTP %s)", response.status_code)
+            support["retry_at"] = float("inf")
+            return None
+        if response.ok:
+            body = orjson.loads(response.content)
+            items = body
+            if isinstance(body, dict):
+                items = body.get("data") or body.get("results") or body.get("result")
+            if isinstance(items, list) and len(items) == len(coords):
+                return items
+        logger.warning("Batch decode returned an unusable response (HTTP %s)", response.status_code)
+    except Exception:
+        logger.exception("Batch decode request failed")
+
+    support["retry_at"] = time.monotonic() + BATCH_RETRY_SECONDS
+    return None
+
+
+def decode_coordinates_batch(coords: list[str]) -> list[DecodeResult]:
+    """Decode several coordinates in one round trip, falling back to concurrent single decodes."""
+    if not coords:
+        return []
+
+    unique = list(dict.fromkeys(coords))
+    warm = _warm_coords(unique)
+    cold = [coord for coord in unique if coord not in warm]
+    items = _fetch_batch(cold) if cold else None
+    entries = dict(zip(cold, items)) if items is not None else {}
+
+    # Cache hits, batch entries and single fetches (batch unavailable, or a cache entry
+    # evicted behind the index's back) all go through the pool, so a walk costs ~one RTT.
+    with ThreadPoolExecutor(max_workers=min(len(unique), MAX_DECODE_WORKERS)) as executor:
+        results = dict(zip(unique, executor.map(lambda coord: _decode(coord, entries.get(coord)), unique)))
+
+    return [results[coord] for coord in coords]
+
+
+
+def _resolve_walk_start(coord: str) -> tuple[str, str | None, str | None, DecodeResult | None]:
+    """Resolve the walk start; also returns the decode used so hop 0 needn't be fetched again."""
     coord = (coord or "").strip()
     if not coord:
-        return coord, None, "Start coordinate required."
+        return coord, None, "Start coordinate required.", None
     if ":" in coord:
         namespace = coord.split(":", 1)[0].strip() or None
-        return coord, namespace, None
+        return coord, namespace, None, None
 
     decoded = decode_coordinate(coord, silent=True)
     if isinstance(decoded, dict) and decoded.get("status") == "success":
@@ -216,25 +434,29 @@ def _resolve_walk_start(coord: str) -> tuple[str, str | None, str | None]:
         meta = decoded.get("meta") or {}
         namespace = meta.get("namespace")
         if isinstance(canonical, str) and canonical:
-            return canonical, namespace, None
+            return canonical, namespace, None, decoded
         if isinstance(namespace, str) and namespace:
-            return f"{namespace}:{coord}", namespace, None
-        return coord, None, None
+            return f"{namespace}:{coord}", namespace, None, decoded
+        return coord, None, None, decoded
 
     detail = None
     if isinstance(decoded, dict):
         detail = decoded.get("detail") or decoded.get("error")
-    return coord, None, detail or "Unable to resolve coordinate namespace."
+    return coord, None, detail or "Unable to resolve coordinate namespace.", None
 
 
 
+_COORD_RE = re.compile(
+    r"\b[0-9a-f]{8}:[0-9a-f]{8}:[A-Z-]+-[A-Za-z0-9]+(?:-[A-Za-z0-9]+)*(?:-P\d+)?\b"
+)
+_PATH_KEYS = ("path", "walk_path")
+_PATH_CONTAINERS = ("payload", "metadata", "meta", "content", "data", "walk")
+
+
 def _extract_coords_from_text(text: str) -> list[str]:
-    pattern = re.compile(
-        r"\b[0-9a-f]{8}:[0-9a-f]{8}:[A-Z-]+-[A-Za-z0-9]+(?:-[A-Za-z0-9]+)*(?:-P\d+)?\b"
-    )
     coords = []
     seen = set()
-    for match in pattern.findall(text or ""):
+    for match in _COORD_RE.findall(text or ""):
         if match in seen:
             continue
         coords.append(match)
@@ -247,19 +469,14 @@ def _extract_walk_path(payload: DecodeResult | dict) -> tuple[list[str] | None,
     if not isinstance(raw, dict):
         return None, None
 
-    for key in ("path", "walk_path"):
-        value = raw.get(key)
-        if isinstance(value, list):
-            steps = raw.get("steps") if isinstance(raw.get("steps"), list) else None
-            return [str(item) for item in value if item], steps
-
-    for container_key in ("payload", "metadata", "meta", "content", "data", "walk"):
-        container = raw.get(container_key)
-        if isinstance(container, dict):
-            value = container.get("path") or container.get("walk_path")
-            if isinstance(value, list):
-                steps = container.get("steps") if isinstance(container.get("steps"), list) else None
-                return [str(item) for item in value if item], steps
+    for level in (raw, *(raw.get(key) for key in _PATH_CONTAINERS)):
+        if not isinstance(level, dict):
+            continue
+        for key in _PATH_KEYS:
+            value = level.get(key)
+            if isinstance(value, list) and value:
+                steps = level.get("steps")
+                return [str(item) for item in value if item], steps if isinstance(steps, list) else None
 
     payload_blob = raw.get("payload")
     if isinstance(payload_blob, dict):
@@ -282,8 +499,15 @@ def _extract_walk_path(payload: DecodeResult | dict) -> tuple[list[str] | None,
 
 
 
-def _walk_row_for_coord(index: int, coord: str) -> dict:
-    details = decode_coordinate(coord, silent=True)
+_WS_RE = re.compile(r"\s+")
+
+
+def _short(text: str, width: int = 140) -> str:
+    return text if len(text) <= width else text[: width - 3].rstrip() + "..."
+
+
+def _walk_row_fields(details: DecodeResult) -> tuple[str, str]:
+    """One-liner and creation time shown for a decoded hop."""
     raw = details.get("raw") if isinstance(details, dict) else {}
     meta = details.get("meta") if isinstance(details, dict) else {}
     content = details.get("content") if isinstance(details, dict) else {}
@@ -296,21 +520,8 @@ def _walk_row_for_coord(index: int, coord: str) -> dict:
     if not one_liner and isinstance(content, dict):
         one_liner = content.get("summary")
     if not one_liner and isinstance(raw, dict):
-        payload = raw.get("payload")
-        if isinstance(payload, dict):
-            blobs = payload.get("blobs")
-            segments = payload.get("segments")
-            if isinstance(blobs, dict) and isinstance(segments, list) and segments:
-                seg = segments[0]
-                if isinstance(seg, dict):
-                    blob_ref = seg.get("blob_ref")
-                    if isinstance(blob_ref, str) and isinstance(blobs.get(blob_ref), str):
-                        one_liner = blobs[blob_ref].strip()
-    if isinstance(one_liner, str):
-        one_liner = one_liner.replace("\n", " ").strip()
-    one_liner = one_liner or ""
-    if len(one_liner) > 140:
-        one_liner = one_liner[:137].rstrip() + "..."
+        one_liner = _first_blob_text(raw.get("payload"))
+    one_liner = _short(_WS_RE.sub(" ", one_liner).strip()) if isinstance(one_liner, str) else ""
 
     created_at = ""
     if isinstance(meta, dict):
@@ -320,27 +531,73 @@ def _walk_row_for_coord(index: int, coord: str) -> dict:
         if isinstance(meta_raw, dict):
             created_at = meta_raw.get("created_at") or ""
 
+    return one_liner, created_at or ""
+
+
+def _walk_rows(path: list[str], known: dict[str, DecodeResult] | None = None) -> dict[str, list]:
+    """Walk table columns for ``path``; coords already decoded in ``known`` are not fetched again."""
+    known = dict(known or {})
+    hops = [(idx, coord) for idx, coord in enumerate(path, start=1) if isinstance(coord, str) and coord]
+    pending = list(dict.fromkeys(coord for _, coord in hops if coord not in known))
+    known.update(zip(pending, decode_coordinates_batch(pending)))
+    details = [_walk_row_fields(known[coord]) for _, coord in hops]
     return {
-        "Number": index,
-        "COORD": coord,
-        "One-liner": one_liner,
-        "Created at": created_at or "",
+        "Number": [idx for idx, _ in hops],
+        "COORD": [coord for _, coord in hops],
+        "One-liner": [one_liner for one_liner, _ in details],
+        "Created at": [created_at for _, created_at in details],
     }
 
 
-def _render_walk_table(path: list[str], *, title: str | None = None) -> None:
+def _render_walk_table(columns: dict[str, list], *, title: str | None = None) -> None:
     if title:
         st.subheader(title)
-    rows = []
-    for idx, coord in enumerate(path, start=1):
-        if not isinstance(coord, str) or not coord:
-            continue
-        rows.append(_walk_row_for_coord(idx, coord))
-    if rows:
-        st.table(rows)
+    if columns["Number"]:
+        st.dataframe(columns, hide_index=True)
     else:
         st.caption("No walk rows to display.")
 
+
+def _walk_inspection_columns(path: list[str], steps: list[dict] | None) -> dict[str, list]:
+    # Hop 0 is the start coordinate; step i describes the hop into path[i + 1].
+    steps = steps or []
+    hop_steps = [
+        steps[idx - 1] if 0 < idx <= len(steps) and isinstance(steps[idx - 1], dict) else _EMPTY
+        for idx in range(len(path))
+    ]
+    return {
+        "hop": list(range(len(path))),
+        "coord": path,
+        "lawfulness": [step.get("lawfulness") or step.get("lawfulness_level") for step in hop_steps],
+        "score": [step.get("score") for step in hop_steps],
+    }
+
+
+def _remember_walk(name: str, params: tuple, result: dict) -> None:
+    """Keep a walk result so display-only reruns (e.g. toggling inspection) skip the network."""
+    st.session_state[name] = {"params": params, "result": result}
+
+
+def _recall_walk(name: str, params: tuple) -> dict | None:
+    """The walk stored under ``name``, if it was produced for the same widget parameters."""
+    stored = st.session_state.get(name)
+    if stored and stored["params"] == params:
+        return stored["result"]
+    return None
+
+
+def _forget_walk(name: str) -> None:
+    st.session_state.pop(name, None)
+
+
+# --- SIDEBAR ---
+
+with st.sidebar:
+    st.caption(f"Decoded coordinates are cached for {DECODE_CACHE_TTL // 60} minutes.")
+    if st.button("Clear decode cache", key="btn_clear_cache"):
+        clear_decode_cache()
+        st.success("Decode cache cleared.")
+
 # --- TABS LAYOUT ---
 
 tab_resolve, tab_walk, tab_walk_history = st.tabs(["Resolve COORD", "COORD Walk Simulator", "Resolve Walk COORD"])
@@ -367,6 +624,7 @@ with tab_walk_history:
         if not walk_coord:
             st.error("Walk coordinate required.")
         else:
+            _forget_walk("walk_history")
             with st.spinner("Resolving walk coordinate..."):
                 walk_payload = decode_coordinate(walk_coord, silent=True)
 
@@ -380,30 +638,22 @@ with tab_walk_history:
                 st.stop()
 
             limited_path = path[:walk_limit]
-            _render_walk_table(limited_path, title="Walk Path")
-
-            if show_walk_inspection:
-                st.divider()
-                st.subheader("Walk Inspection")
-                inspection_rows = []
-                for idx, coord in enumerate(limited_path):
-                    hop_score = None
-                    hop_law = None
-                    if steps and idx > 0 and idx - 1 < len(steps):
-                        step = steps[idx - 1] if isinstance(steps[idx - 1], dict) else {}
-                        hop_score = step.get("score")
-                        hop_law = step.get("lawfulness") or step.get("lawfulness_level")
-                    inspection_rows.append(
-                        {
-                            "hop": idx,
-                            "coord": coord,
-                            "lawfulness": hop_law,
-                            "score": hop_score,
-                        }
-                    )
-                st.table(inspection_rows)
-                with st.expander("View Walk JSON"):
-                    st.json(walk_payload.get("raw"))
+            _remember_walk("walk_history", (walk_coord, walk_limit), {
+                "rows": _walk_rows(limited_path),
+                "inspection": _walk_inspection_columns(limited_path, steps),
+                "raw": walk_payload.get("raw"),
+            })
+
+    walk_history = _recall_walk("walk_history", (walk_coord, walk_limit))
+    if walk_history:
+        _render_walk_table(walk_history["rows"], title="Walk Path")
+
+        if show_walk_inspection:
+            st.divider()
+            st.subheader("Walk Inspection")
+            st.dataframe(walk_history["inspection"], hide_index=True)
+            with st.expander("View Walk JSON"):
+                st.json(walk_history["raw"])
 
 # ==========================================
 # TAB 1: RESOLVE COORD
@@ -481,7 +731,8 @@ with tab_walk:
         if not start_coord:
             st.error("Start coordinate required.")
         else:
-            resolved_start, namespace_hint, resolve_error = _resolve_walk_start(start_coord)
+            _forget_walk("walk_sim")
+            resolved_start, namespace_hint, resolve_error, start_decoded = _resolve_walk_start(start_coord)
             if resolve_error:
                 st.error(f"Start coordinate unresolved: {resolve_error}")
                 st.stop()
@@ -489,19 +740,19 @@ with tab_walk:
             with st.spinner("Calculating optimal traversal path..."):
                 walk_data: dict = {}
                 try:
-                    walk_resp = requests.post(
+                    walk_resp = _session().post(
                         f"{API_BASE}/chat/coord/walk",
-                        json={
+                        data=orjson.dumps({
                             "start_coord": resolved_start,
                             "max_steps": hop_count,
                             "current_coherence": 0.8,
                             "namespace": namespace_hint,
-                        },
-                        headers={"Content-Type": "application/json"}
+                        }),
+                        timeout=REQUEST_TIMEOUT,
                     )
-                    walk_data = walk_resp.json()
+                    walk_data = _load_body(walk_resp)
                     if (not walk_resp.ok) or walk_data.get("status") == "error":
-                        detail = walk_data.get("detail") or walk_data.get("error") or walk_resp.text
+                        detail = walk_data.get("detail") or walk_data.get("error") or _body_excerpt(walk_resp)
                         st.error(f"Walk failed: {detail}")
                         st.stop()
                 except Exception as e:
@@ -519,11 +770,19 @@ with tab_walk:
                 path.insert(0, resolved_start)
 
             limited_path = path[: max(hop_count + 1, 1)]
-            _render_walk_table(limited_path, title="Simulated Walk Path")
-
-            if show_walk_inspection:
-                st.divider()
-                st.subheader("Walk Inspection")
-                st.caption(f"Termination: {termination_reason}")
-                with st.expander("Walk Inspection Data"):
-                    st.json(walk_data)
+            _remember_walk("walk_sim", (start_coord, hop_count), {
+                "rows": _walk_rows(limited_path, {resolved_start: start_decoded} if start_decoded else None),
+                "termination_reason": termination_reason,
+                "walk_data": walk_data,
+            })
+
+    walk_result = _recall_walk("walk_sim", (start_coord, hop_count))
+    if walk_result:
+        _render_walk_table(walk_result["rows"], title="Simulated Walk Path")
+
+        if show_walk_inspection:
+            st.divider()
+            st.subheader("Walk Inspection")
+            st.caption(f"Termination: {walk_result['termination_reason']}")
+            with st.expander("Walk Inspection Data"):
+                st.json(walk_result["walk_data"])